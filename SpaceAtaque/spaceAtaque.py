@@ -3,9 +3,18 @@ import random
 import os
 import json
 import math
+import queue
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson  # opcional: codec JSON em Rust, usado nos saves quando instalado
+except ImportError:
+    orjson = None
 
 CURRENT_GAME = None
 
@@ -35,6 +44,9 @@ class GameConfig:
 @dataclass
 class DifficultyConfig:
     """Configuração de dificuldade"""
+    # __slots__ manual (dataclass(slots=True) exige Python 3.10+); campos sem valor padrão
+    __slots__ = ("enemies", "speed_min", "speed_max", "lives")
+
     enemies: int
     speed_min: int
     speed_max: int
@@ -65,6 +77,18 @@ class Colors:
     YELLOW = (255, 215, 0)
     DARK_RED = (255, 0, 0)
 
+# Eventos próprios (timers do SDL)
+PHASE_ADVANCE_EVENT = pygame.USEREVENT + 1     # fim da tela de fase vencida
+PHASE_COUNTDOWN_EVENT = pygame.USEREVENT + 2   # atualiza a contagem regressiva a cada segundo
+
+# Únicos eventos tratados pelos menus; os demais (mouse etc.) são descartados sem virar objetos Python
+MENU_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED)
+
+# Todos os eventos que o jogo trata; os demais são bloqueados já na fila do SDL
+HANDLED_EVENTS = MENU_EVENTS + (
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, PHASE_ADVANCE_EVENT, PHASE_COUNTDOWN_EVENT,
+)
+
 # Assets
 ASSETS = {
     "background_level_1": "Assets/Levels/Level_1/backgroundL1.png",
@@ -109,6 +133,16 @@ class Sizes:
     BULLET_SPEED = -12  # velocidade vertical (negativa = para cima)
     FIRE_COOLDOWN_MS = 200  # intervalo mínimo entre disparos contínuos
     BOSS = (220, 160)
+    EXPLOSION = (80, 80)  # explosão de nave inimiga
+
+# Tamanho da tela atual, compartilhado pelas entidades (evita consultar o SDL a cada spawn)
+class ScreenInfo:
+    width = 0
+    height = 0
+
+    @classmethod
+    def update(cls, surface: pygame.Surface):
+        cls.width, cls.height = surface.get_size()
 
 # =============================================================================
 # GERENCIADOR DE RECURSOS
@@ -119,38 +153,125 @@ class ResourceManager:
         self.asset_dir = asset_dir
         self.images = {}
         self.sounds = {}
+        self.frames: Dict[str, List[pygame.Surface]] = {}
+        self._scaled: Dict[Tuple[str, Tuple[int, int], bool], pygame.Surface] = {}
+        self._paths: Dict[str, str] = {}
+        self._existing_files: Optional[set] = None
+        self._decoded: Dict[str, object] = {}  # caminho -> Surface/Sound pré-decodificado
 
     def _resolve_path(self, filename: str) -> str:
-        """Resolve caminho relativo ao diretório de assets"""
-        if os.path.isabs(filename):
-            return filename
-        return os.path.join(self.asset_dir, filename)
+        """Resolve caminho relativo ao diretório de assets (memoizado)"""
+        path = self._paths.get(filename)
+        if path is None:
+            if os.path.isabs(filename):
+                path = os.path.normpath(filename)
+            else:
+                path = os.path.normpath(os.path.join(self.asset_dir, filename))
+            self._paths[filename] = path
+        return path
+
+    def _exists(self, path: str) -> bool:
+        """Verifica existência do arquivo usando uma única varredura do diretório de assets"""
+        if self._existing_files is None:
+            existing = set()
+            for root, _dirs, files in os.walk(self.asset_dir):
+                for name in files:
+                    existing.add(os.path.normpath(os.path.join(root, name)))
+            self._existing_files = existing
+        if path in self._existing_files:
+            return True
+        # Caminhos fora do diretório de assets não entram na varredura
+        return not path.startswith(os.path.normpath(self.asset_dir)) and os.path.exists(path)
+
+    def prefetch(self, filenames, max_workers: int = 4):
+        """Lê e decodifica imagens e sons em paralelo antes do carregamento propriamente dito.
+        Nas threads roda só a decodificação (pygame.image.load / mixer.Sound liberam o GIL);
+        convert e scale continuam na thread principal, em load_image."""
+        sound_ok = bool(pygame.mixer.get_init())
+        tasks = []
+        seen = set(self._decoded)
+        for filename in filenames:
+            path = self._resolve_path(filename)
+            if path in seen or not self._exists(path):
+                continue
+            seen.add(path)
+            ext = os.path.splitext(path)[1].lower()
+            if ext in (".png", ".jpg", ".jpeg"):
+                tasks.append((path, pygame.image.load))
+            elif ext in (".mp3", ".ogg", ".wav") and sound_ok:
+                tasks.append((path, pygame.mixer.Sound))
+        if not tasks:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            futures = [(path, executor.submit(loader, path)) for path, loader in tasks]
+            for path, future in futures:
+                try:
+                    self._decoded[path] = future.result()
+                except Exception as e:
+                    print(f"Aviso: falha ao decodificar '{path}': {e}")
+
+    def load_surface(self, path: str) -> pygame.Surface:
+        """Superfície crua (sem convert) do arquivo, usando a pré-decodificada se houver"""
+        img = self._decoded.pop(path, None)
+        if img is None:
+            img = pygame.image.load(path)
+        return img
 
     def load_image(self, key: str, filename: str, size: tuple,
-                   fallback_color: tuple) -> pygame.Surface:
-        """Carrega imagem com fallback para cor sólida"""
+                   fallback_color: tuple, alpha: bool = True) -> pygame.Surface:
+        """Carrega imagem com fallback para cor sólida.
+        alpha=False converte para o formato da tela sem canal alfa (fundos opacos)"""
         if key in self.images:
             return self.images[key]
 
         path = self._resolve_path(filename)
-        if os.path.exists(path):
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, size)
-        else:
-            img = pygame.Surface(size)
-            img.fill(fallback_color)
+        # Mesmo arquivo no mesmo tamanho é carregado e escalado uma única vez
+        cache_key = (path, tuple(size), alpha)
+        img = self._scaled.get(cache_key)
+        if img is None:
+            if self._exists(path):
+                img = self.load_surface(path)
+                img = img.convert_alpha() if alpha else img.convert()
+                img = pygame.transform.scale(img, size)
+                self._scaled[cache_key] = img
+            else:
+                img = pygame.Surface(size).convert()
+                img.fill(fallback_color)
 
         self.images[key] = img
         return img
 
+    def load_frames(self, dirname: str) -> List[pygame.Surface]:
+        """Carrega (uma vez) os frames de animação de um diretório, em ordem alfabética"""
+        if dirname in self.frames:
+            return self.frames[dirname]
+
+        frames: List[pygame.Surface] = []
+        dir_path = self._resolve_path(dirname)
+        try:
+            if os.path.isdir(dir_path):
+                for fname in sorted(os.listdir(dir_path)):
+                    if fname.lower().endswith((".png", ".jpg", ".jpeg")):
+                        try:
+                            frames.append(pygame.image.load(os.path.join(dir_path, fname)).convert_alpha())
+                        except Exception as e:
+                            print(f"Aviso: falha ao carregar frame '{fname}' de {dirname}: {e}")
+        except Exception as e:
+            print(f"Aviso: falha ao listar frames de {dirname}: {e}")
+
+        self.frames[dirname] = frames
+        return frames
+
     def load_sound(self, key: str, filename: str) -> Optional[pygame.mixer.Sound]:
         """Carrega som"""
         if key in self.sounds:
             return self.sounds[key]
 
         path = self._resolve_path(filename)
-        if os.path.exists(path):
-            sound = pygame.mixer.Sound(path)
+        if self._exists(path):
+            sound = self._decoded.pop(path, None)
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
             self.sounds[key] = sound
             return sound
         return None
@@ -158,7 +279,7 @@ class ResourceManager:
     def load_music(self, filename: str, volume: float = 0.3) -> bool:
         """Carrega e toca música de fundo"""
         path = self._resolve_path(filename)
-        if os.path.exists(path):
+        if self._exists(path):
             try:
                 pygame.mixer.music.load(path)
                 pygame.mixer.music.set_volume(volume)
@@ -179,9 +300,10 @@ class Enemy(pygame.sprite.Sprite):
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed = speed
+        self._rect_w = self.rect.width  # imagem fixa: largura constante
 
-        self.screen_width = pygame.display.get_surface().get_width()
-        self.screen_height = pygame.display.get_surface().get_height()
+        self.screen_width = ScreenInfo.width
+        self.screen_height = ScreenInfo.height
 
     def update(self):
         self.rect.y += self.speed
@@ -189,15 +311,18 @@ class Enemy(pygame.sprite.Sprite):
             self.randomize_position()
 
     def randomize_position(self):
-        self.rect.y = random.randint(-100, -40)
+        # random.random() direto: randint valida argumentos a cada chamada e é bem mais lento
+        rnd = random.random
+        self.rect.y = -100 + int(rnd() * 61)
+        w = self._rect_w
         x_min = 0
-        x_max = self.screen_width - self.rect.width
-        game_current = globals().get('CURRENT_GAME', None)
+        x_max = self.screen_width - w
+        game_current = CURRENT_GAME
         if game_current and getattr(game_current, 'boss_spawned', False) and getattr(game_current, 'boss', None) and not getattr(game_current, 'boss_defeated', False):
-            forbid = game_current.get_boss_forbidden_x_range(self.rect.width)
+            forbid = game_current.get_boss_forbidden_x_range(w)
             if forbid is not None:
                 lx, rx = forbid
-                left_end = max(x_min, lx - self.rect.width)
+                left_end = max(x_min, lx - w)
                 right_start = min(x_max, rx + 1)
                 intervals = []
                 if left_end > x_min:
@@ -205,10 +330,11 @@ class Enemy(pygame.sprite.Sprite):
                 if right_start < x_max:
                     intervals.append((right_start, x_max))
                 if intervals:
-                    seg = random.choice(intervals)
-                    self.rect.x = random.randint(seg[0], max(seg[0], seg[1]))
+                    seg = intervals[int(rnd() * len(intervals))]
+                    lo = seg[0]
+                    self.rect.x = lo + int(rnd() * (max(lo, seg[1]) - lo + 1))
                     return
-        self.rect.x = random.randint(x_min, x_max)
+        self.rect.x = x_min + int(rnd() * (x_max - x_min + 1))
 
 class Item(pygame.sprite.Sprite):
     """Representa um item coletável como um Sprite"""
@@ -217,7 +343,7 @@ class Item(pygame.sprite.Sprite):
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed = speed
-        self.screen_height = pygame.display.get_surface().get_height()
+        self.screen_height = ScreenInfo.height
 
     def update(self):
         """Move o item para baixo; remove quando sai da tela."""
@@ -238,13 +364,42 @@ class Boss(pygame.sprite.Sprite):
 
 class Bullet(pygame.sprite.Sprite):
     """Projétil disparado pelo jogador (sobe e destrói naves inimigas)."""
+    # Uma superfície por cor, compartilhada por todos os projéteis (nunca é alterada)
+    _templates: Dict[tuple, pygame.Surface] = {}
+    # Projéteis removidos ficam guardados para reuso (limitado a POOL_MAX)
+    _pool: List["Bullet"] = []
+    POOL_MAX = 64
+
     def __init__(self, x: int, y: int, color: tuple = Colors.YELLOW):
         super().__init__()
-        self.image = pygame.Surface((Sizes.BULLET[0], Sizes.BULLET[1]))
-        self.image.fill(color)
+        img = Bullet._templates.get(color)
+        if img is None:
+            img = pygame.Surface((Sizes.BULLET[0], Sizes.BULLET[1])).convert()
+            img.fill(color)
+            Bullet._templates[color] = img
+        self.image = img
         self.rect = self.image.get_rect(center=(x, y))
         self.vy = Sizes.BULLET_SPEED
 
+    @classmethod
+    def acquire(cls, x: int, y: int) -> "Bullet":
+        """Retorna um projétil amarelo na posição dada, reaproveitando um do pool se houver"""
+        if cls._pool:
+            bullet = cls._pool.pop()
+            bullet.reset(x, y)
+            return bullet
+        return cls(x, y)
+
+    def reset(self, x: int, y: int):
+        self.rect.center = (x, y)
+        self.vy = Sizes.BULLET_SPEED
+
+    def kill(self):
+        """Remove dos grupos e devolve ao pool (só na primeira remoção)"""
+        if self.alive() and self.image is Bullet._templates.get(Colors.YELLOW) and len(Bullet._pool) < Bullet.POOL_MAX:
+            Bullet._pool.append(self)
+        super().kill()
+
     def update(self):
         """Atualiza posição do projétil. Se auto-destrói se sair do topo."""
         self.rect.y += self.vy
@@ -253,29 +408,46 @@ class Bullet(pygame.sprite.Sprite):
 
 class Explosion(pygame.sprite.Sprite):
     """Animação de explosão baseada em sprite sheet quando uma nave inimiga é destruída."""
-    def __init__(self, center: tuple, frames: List[pygame.Surface], frame_time_ms: int = 40, scale: Optional[tuple] = None, lifetime_ms: int = 500):
+    # Frames já redimensionados, por (lista de origem, escala): o smoothscale roda uma vez só.
+    # A lista de origem fica referenciada na entrada para que seu id não seja reaproveitado.
+    _scaled_cache: Dict[tuple, tuple] = {}
+
+    def __init__(self, center: tuple, frames: List[pygame.Surface], frame_time_ms: int = 40, scale: Optional[tuple] = None, lifetime_ms: int = 500,
+                 fps: int = GameConfig.FPS):
         super().__init__()
-        self.frames = frames
-        if scale is not None and len(frames) > 0:
-            self.frames = [pygame.transform.smoothscale(f, scale) for f in frames]
-        self.frame_time_ms = frame_time_ms
+        self.frames = Explosion.scaled_frames(frames, scale) if scale is not None else frames
         self.current = 0
-        self.spawn_time = pygame.time.get_ticks()
-        self.last_change = self.spawn_time
-        self.lifetime_ms = lifetime_ms
+        # Tempos convertidos em quadros: o gameplay roda em FPS fixo
+        self._step_frames = max(1, round(frame_time_ms * fps / 1000))
+        self._lifetime_frames = max(1, round(lifetime_ms * fps / 1000))
+        self._age = 0
+        self._counter = 0
         self.image = self.frames[0] if self.frames else pygame.Surface((40, 40), pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=center)
 
+    @classmethod
+    def scaled_frames(cls, frames: List[pygame.Surface], scale: tuple) -> List[pygame.Surface]:
+        """Frames redimensionados para scale, calculados uma vez e guardados no cache"""
+        if not frames or tuple(scale) == frames[0].get_size():
+            return frames
+        key = (id(frames), tuple(scale))
+        cached = cls._scaled_cache.get(key)
+        if cached is None or cached[0] is not frames:
+            cached = (frames, [pygame.transform.smoothscale(f, scale) for f in frames])
+            cls._scaled_cache[key] = cached
+        return cached[1]
+
     def update(self):
         if not self.frames:
             self.kill()
             return
-        now = pygame.time.get_ticks()
-        if now - self.spawn_time >= self.lifetime_ms:
+        self._age += 1
+        if self._age >= self._lifetime_frames:
             self.kill()
             return
-        if now - self.last_change >= self.frame_time_ms:
-            self.last_change = now
+        self._counter += 1
+        if self._counter >= self._step_frames:
+            self._counter = 0
             self.current += 1
             if self.current >= len(self.frames):
                 self.kill()
@@ -317,12 +489,12 @@ class ShieldAura(pygame.sprite.Sprite):
             pygame.draw.circle(self.image, (*self.color_glow, 90), (px, py), self.glow_radius)
             pygame.draw.circle(self.image, self.color_main, (px, py), self.particle_radius)
 
-    def update(self):
+    def update(self, now_ms: Optional[int] = None):
         if not hasattr(self.player, 'rect'):
             self.kill()
             return
         self.rect.center = self.player.rect.center
-        now = pygame.time.get_ticks()
+        now = now_ms if now_ms is not None else pygame.time.get_ticks()
         dt = max(0, now - self.last_update_ms) / 1000.0
         self.last_update_ms = now
         delta_deg = self.angular_speed * dt
@@ -331,6 +503,14 @@ class ShieldAura(pygame.sprite.Sprite):
 
 class Player(pygame.sprite.Sprite):
     """Representa o jogador como um Sprite"""
+    # Teclas (esquerda, direita, cima, baixo) de cada esquema de controle, resolvidas uma vez
+    _ARROW_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+    _WASD_KEYS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s)
+    CONTROL_KEYS = {
+        "both": (_ARROW_KEYS, _WASD_KEYS),
+        "arrows": (_ARROW_KEYS,),
+        "wasd": (_WASD_KEYS,),
+    }
 
     def __init__(self, x: int, y: int, idle_img: pygame.Surface,
                  up_img: pygame.Surface, control_scheme: str = "both"):
@@ -342,31 +522,47 @@ class Player(pygame.sprite.Sprite):
 
         self.image = self.current_img
         self.rect = self.image.get_rect(center=(x, y))
+        self._half_w = self.rect.width >> 1
+        self._half_h = self.rect.height >> 1
 
         self.speed = Sizes.PLAYER_SPEED
         self.moving_up = False
+        self._screen_size: Optional[tuple] = None
+        self._bounds_x = (0, 0)
+        self._bounds_y = (0, 0)
+
+    def set_screen_size(self, screen_width: int, screen_height: int):
+        """Pré-calcula os limites do centro da nave para o tamanho de tela dado"""
+        half_w, half_h = self._half_w, self._half_h
+        self._screen_size = (screen_width, screen_height)
+        self._bounds_x = (half_w, screen_width - half_w)
+        self._bounds_y = (half_h, screen_height - half_h)
 
     def move_to_position(self, x: int, y: int, screen_width: int, screen_height: int):
-        half_w, half_h = self.rect.width // 2, self.rect.height // 2
-        clamped_x = max(half_w, min(screen_width - half_w, x))
-        clamped_y = max(half_h, min(screen_height - half_h, y))
-        self.rect.center = (clamped_x, clamped_y)
+        if self._screen_size != (screen_width, screen_height):
+            self.set_screen_size(screen_width, screen_height)
+        bx, by = self._bounds_x, self._bounds_y
+        self.rect.center = (bx[0] if x < bx[0] else bx[1] if x > bx[1] else x,
+                            by[0] if y < by[0] else by[1] if y > by[1] else y)
 
     def update(self, keys, screen_width: int, screen_height: int):
-        use_arrows = self.control_scheme in ("both", "arrows")
-        use_wasd = self.control_scheme in ("both", "wasd")
-
-        if ((use_arrows and keys[pygame.K_LEFT]) or (use_wasd and keys[pygame.K_a])) and self.rect.left > 0:
-            self.rect.x -= self.speed
-        if ((use_arrows and keys[pygame.K_RIGHT]) or (use_wasd and keys[pygame.K_d])) and self.rect.right < screen_width:
-            self.rect.x += self.speed
-
-        self.moving_up = False
-        if ((use_arrows and keys[pygame.K_UP]) or (use_wasd and keys[pygame.K_w])) and self.rect.top > 0:
-            self.rect.y -= self.speed
-            self.moving_up = True
-        if ((use_arrows and keys[pygame.K_DOWN]) or (use_wasd and keys[pygame.K_s])) and self.rect.bottom < screen_height:
-            self.rect.y += self.speed
+        # Lê o estado de cada direção uma única vez
+        left = right = up = down = False
+        for k_left, k_right, k_up, k_down in Player.CONTROL_KEYS.get(self.control_scheme, ()):
+            left = left or keys[k_left]
+            right = right or keys[k_right]
+            up = up or keys[k_up]
+            down = down or keys[k_down]
+
+        # Deslocamento líquido por eixo, preso às bordas da tela com min/max
+        rect = self.rect
+        self.moving_up = bool(up) and rect.top > 0
+        dx = (right - left) * self.speed
+        dy = (down - up) * self.speed
+        if dx:
+            rect.x = max(0, min(screen_width - rect.width, rect.x + dx))
+        if dy:
+            rect.y = max(0, min(screen_height - rect.height, rect.y + dy))
 
         self.current_img = self.up_img if self.moving_up else self.idle_img
         self.image = self.current_img
@@ -375,14 +571,136 @@ class Player(pygame.sprite.Sprite):
         """Reposiciona o jogador"""
         self.rect.center = (x, y)
 
+# =============================================================================
+# COLISÕES
+# =============================================================================
+
+class SpatialGrid:
+    """Hash espacial de células uniformes para a broad-phase de colisões.
+    Cada sprite é inserido em todas as células que seu rect cobre; uma consulta
+    só testa os sprites das células cobertas pelo retângulo consultado."""
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[tuple, List[pygame.sprite.Sprite]] = {}
+
+    def _cell_span(self, rect: pygame.Rect):
+        cs = self.cell_size
+        return (range(rect.left // cs, (rect.right - 1) // cs + 1),
+                range(rect.top // cs, (rect.bottom - 1) // cs + 1))
+
+    def build(self, sprites: List[pygame.sprite.Sprite]):
+        """Reconstrói a grade a partir dos sprites informados."""
+        cells = {}
+        for spr in sprites:
+            cols, rows = self._cell_span(spr.rect)
+            for cx in cols:
+                for cy in rows:
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [spr]
+                    else:
+                        bucket.append(spr)
+        self.cells = cells
+
+    def query(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Retorna os sprites da grade cujo rect colide com `rect`."""
+        found = []
+        seen = set()
+        cells = self.cells
+        cols, rows = self._cell_span(rect)
+        for cx in cols:
+            for cy in rows:
+                for spr in cells.get((cx, cy), ()):
+                    if spr not in seen:
+                        seen.add(spr)
+                        if rect.colliderect(spr.rect):
+                            found.append(spr)
+        return found
+
 # =============================================================================
 # GERENCIADOR DE SAVE
 # =============================================================================
 
+def _json_dumps(data: Dict) -> bytes:
+    """Serializa para bytes UTF-8 (orjson quando disponível, senão json)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(raw: bytes):
+    """Desserializa bytes UTF-8 (orjson quando disponível, senão json)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Saves grandes são gravados comprimidos (zlib nível 1) atrás deste cabeçalho;
+# os pequenos continuam JSON puro, legível e compatível com saves antigos
+SAVE_ZLIB_MAGIC = b"SAZ\x01"
+SAVE_COMPRESS_MIN_BYTES = 4096
+
+def _encode_save(data: Dict) -> bytes:
+    """Serializa o save, comprimindo quando o JSON passa de SAVE_COMPRESS_MIN_BYTES"""
+    raw = _json_dumps(data)
+    if len(raw) < SAVE_COMPRESS_MIN_BYTES:
+        return raw
+    return SAVE_ZLIB_MAGIC + zlib.compress(raw, 1)
+
+def _decode_save(raw: bytes):
+    """Inverso de _encode_save: aceita JSON puro ou o formato comprimido"""
+    if raw[:len(SAVE_ZLIB_MAGIC)] == SAVE_ZLIB_MAGIC:
+        raw = zlib.decompress(raw[len(SAVE_ZLIB_MAGIC):])
+    return _json_loads(raw)
+
 class SaveManager:
-    """Gerencia salvamento e carregamento do jogo"""
+    """Gerencia salvamento e carregamento do jogo.
+    A escrita em disco acontece numa thread própria: save() só enfileira os dados
+    (fila de uma posição; um save pendente é substituído pelo mais recente)."""
     def __init__(self, save_path: str):
         self.save_path = save_path
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=1)
+        self._writer: Optional[threading.Thread] = None
+        self._highscore_cache: Optional[int] = None
+        self._last_saved_key: Optional[tuple] = None
+
+    def _write_loop(self):
+        """Thread de escrita: serializa e grava de forma atômica (tmp + os.replace)"""
+        while True:
+            data = self._queue.get()
+            try:
+                payload = _encode_save(data)
+                tmp_path = self.save_path + ".tmp"
+                with open(tmp_path, "wb", buffering=1 << 16) as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.save_path)
+            except Exception as e:
+                print(f"Erro ao salvar: {e}")
+                # Nada foi gravado: o próximo save com o mesmo estado deve tentar de novo,
+                # e o highscore volta a ser lido do disco
+                self._last_saved_key = None
+                self._highscore_cache = None
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, data: Dict):
+        """Entrega os dados à thread de escrita, descartando um save ainda não gravado"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="SaveWriter", daemon=True)
+            self._writer.start()
+        while True:
+            try:
+                self._queue.put_nowait(data)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def flush(self):
+        """Aguarda a gravação de qualquer save pendente"""
+        if self._writer is not None:
+            self._queue.join()
 
     def save(self, difficulty: str, score: int, lives: int,
              phase: int, player_pos: tuple,
@@ -406,8 +724,17 @@ class SaveManager:
                     data["sound_enabled"] = dict(CURRENT_GAME.sound_enabled)
             except Exception as e:
                 print(f"Aviso: falha ao salvar configurações de som: {e}")
-            with open(self.save_path, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+            # Estado idêntico ao último save: nada a serializar nem gravar
+            key = (difficulty, score, lives, phase,
+                   tuple(player_pos) if player_pos is not None else None,
+                   items_collected, boss_defeated, highscore,
+                   tuple(sorted(data.get("volumes", {}).items())),
+                   tuple(sorted(data.get("sound_enabled", {}).items())))
+            if key == self._last_saved_key:
+                return highscore
+            self._last_saved_key = key
+            self._enqueue(data)
+            self._highscore_cache = highscore
             return highscore
         except Exception as e:
             print(f"Erro ao salvar: {e}")
@@ -415,35 +742,72 @@ class SaveManager:
 
     def load(self) -> Optional[Dict]:
         """Carrega jogo salvo"""
+        self.flush()
         try:
-            if not os.path.exists(self.save_path):
+            # Arquivo pequeno: lido inteiro em uma única chamada de sistema.
+            # Sem checagem prévia de existência: a ausência aparece no próprio open
+            try:
+                fd = os.open(self.save_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except FileNotFoundError:
                 return None
-            with open(self.save_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            try:
+                raw = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            data = _decode_save(raw)
+            # O disco passa a ser a referência: o próximo save nunca é descartado como repetido
+            self._last_saved_key = None
+            if isinstance(data, dict):
+                self._highscore_cache = data.get("highscore", 0)
+            return data
         except Exception as e:
             print(f"Erro ao carregar: {e}")
             return None
 
     def get_highscore(self) -> int:
-        """Retorna o highscore salvo"""
-        data = self.load()
-        return data.get("highscore", 0) if data else 0
+        """Retorna o highscore salvo (lido do disco só na primeira vez)"""
+        if self._highscore_cache is None:
+            data = self.load()
+            self._highscore_cache = data.get("highscore", 0) if data else 0
+        return self._highscore_cache
 
 
 # =============================================================================
 # GAME ENGINE
 # =============================================================================
 
+def _noop(*_args, **_kwargs):
+    """Substituto de play() quando o som não foi carregado"""
+    return None
+
+def _throttled_play(play, min_interval_ms: int):
+    """Envolve play() ignorando chamadas a menos de min_interval_ms da última tocada"""
+    last_ms = [-min_interval_ms]
+    get_ticks = pygame.time.get_ticks
+
+    def _play():
+        now = get_ticks()
+        if now - last_ms[0] >= min_interval_ms:
+            last_ms[0] = now
+            play()
+    return _play
+
 def _next_multiple_of_20_above(value: int) -> int:
-    rem = value % 20
-    return value + (20 - rem) if rem != 0 else value + 20
+    """Menor múltiplo de 20 estritamente maior que value"""
+    return (value // 20 + 1) * 20
 
 def _next_multiple_of_33_above(value: int) -> int:
-    rem = value % 33
-    return value + (33 - rem) if rem != 0 else value + 33
+    """Menor múltiplo de 33 estritamente maior que value"""
+    return (value // 33 + 1) * 33
 
 
 def _normalize_volume_value(value) -> float:
+    # Caminhos rápidos: float já normalizado ou int em porcentagem (tipo exato, sem isinstance)
+    t = type(value)
+    if t is float and 0.0 <= value <= 1.0:
+        return value
+    if t is int and 0 <= value <= 100:
+        return value / 100.0
     if isinstance(value, int):
         if 0 <= value <= 100:
             return value / 100.0
@@ -459,6 +823,13 @@ def _normalize_volume_value(value) -> float:
 
 class SpaceAtaque:
     """Classe principal do jogo"""
+    # Tabelas por fase (índice min(fase, 2)): pontuação alvo, itens exigidos e velocidade dos itens
+    PHASE_TARGETS = (100, 250, 350)
+    PHASE_REQUIRED_ITEMS = (0, 3, 3)
+    PHASE_ITEM_SPEEDS = (8, 7, 8)
+    # Passos de simulação no máximo por quadro desenhado (evita espiral quando o desenho atrasa)
+    MAX_UPDATE_STEPS = 4
+
     def __init__(self):
         pygame.init()
         try:
@@ -469,9 +840,19 @@ class SpaceAtaque:
             pass
 
         self.config = GameConfig()
-        self.screen = pygame.display.set_mode((self.config.WIDTH, self.config.HEIGHT))
+        try:
+            # SCALED apresenta a tela via renderer do SDL2 (cópia na GPU quando disponível)
+            self.screen = pygame.display.set_mode(
+                (self.config.WIDTH, self.config.HEIGHT), pygame.SCALED | pygame.DOUBLEBUF
+            )
+        except pygame.error as e:
+            print(f"Aviso: modo de vídeo acelerado indisponível, usando padrão: {e}")
+            self.screen = pygame.display.set_mode((self.config.WIDTH, self.config.HEIGHT))
+        ScreenInfo.update(self.screen)
         pygame.display.set_caption(self.config.TITLE)
         self.clock = pygame.time.Clock()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
 
         global CURRENT_GAME
         CURRENT_GAME = self
@@ -523,6 +904,24 @@ class SpaceAtaque:
         self.player_group = pygame.sprite.GroupSingle()         # Grupo especial para o jogador
         self.boss_group = pygame.sprite.GroupSingle()           # Grupo para o chefe
         self.shield_aura_group = pygame.sprite.GroupSingle()    # Efeito visual do escudo
+        # Grupos esvaziados a cada novo jogo/fase (player_group fica de fora)
+        self._game_groups = (
+            self.enemy_group, self.item_group, self.shield_group, self.bullet_group,
+            self.explosion_group, self.boss_group, self.shield_aura_group, self.all_sprites,
+        )
+
+        # Renderização por retângulos sujos no gameplay
+        self._prev_draw_rects: List[pygame.Rect] = []
+        self._full_redraw_pending = True
+
+        # Simulação em passo fixo de 1/FPS s, desacoplada do desenho.
+        # None: o relógio precisa ser ressincronizado ao (re)entrar no gameplay
+        self._update_step_ms = 1000.0 / self.config.FPS
+        self._update_accum_ms: Optional[float] = None
+
+        # Broad-phase das colisões projétil x inimigo; células ~1.5x a largura da nave
+        # para que cada inimigo ocupe no máximo 2x2 células
+        self._enemy_grid = SpatialGrid(cell_size=int(Sizes.ENEMY[0] * 1.5))
 
         self.state = GameState.MENU
         
@@ -552,10 +951,13 @@ class SpaceAtaque:
         self.score = 0
         self.lives = 0
         self.phase = 0
+        self._phase_cfg_key = None
+        self._phase_cfg: Optional[DifficultyConfig] = None
         self.player = None
         self.player2 = None
         self.multiplayer = False
         self.phase_victory_end = None
+        self._phase_victory_dirty = False
         self.items_collected = 0
         self.boss_defeated = False
         self.boss = None
@@ -574,20 +976,46 @@ class SpaceAtaque:
         self.font_small = pygame.font.Font(None, 48)
         self.font_tiny = pygame.font.Font(None, 36)
 
+        # Textos da tela de fase vencida: renderizados só quando mudam
+        self._phase_victory_title = self.font_large.render("Fase vencida!", True, Colors.YELLOW)
+        self._phase_label_cache = (None, None)
+        self._timer_text_cache = (None, None)
+
+        # HUD do gameplay: as duas linhas são re-renderizadas só quando o estado exibido muda
+        self._hud_key = None
+        self._hud_surf: Optional[pygame.Surface] = None
+        self._hud_obj_surf: Optional[pygame.Surface] = None
+
+        # Textos fixos do menu principal; opções renderizadas nas duas cores (normal, selecionada)
+        self._menu_title_surf = self.font_medium.render("SPACE ATAQUE", True, Colors.YELLOW)
+        self._menu_title_pos = (self.config.WIDTH // 2 - self._menu_title_surf.get_width() // 2, 80)
+        self._menu_option_surfs: Optional[List[Tuple[pygame.Surface, pygame.Surface, Tuple[int, int]]]] = None
+        self._menu_msg_text = ""
+        self._menu_msg_surf: Optional[pygame.Surface] = None
+        # Linhas variáveis do menu: (valor exibido, superfície), re-renderizadas só quando o valor muda
+        self._menu_highscore_cache = (None, None)
+        self._menu_difficulty_cache = (None, None)
+
+        # Véu semitransparente da pausa (alocado uma única vez)
+        self._pause_overlay = pygame.Surface((self.config.WIDTH, self.config.HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 160))
+
     def _load_resources(self):
         """Carrega todos os recursos do jogo"""
-        self.bg_levels = [
-            self.resources.load_image("bg_level_1", ASSETS["background_level_1"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE),
-            self.resources.load_image("bg_level_2", ASSETS["background_level_2"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE),
-            self.resources.load_image("bg_level_3", ASSETS["background_level_3"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE),
-        ]
+        # Decodificação de todas as imagens e sons do ASSETS em paralelo (a música é tocada em streaming)
+        self.resources.prefetch(f for k, f in ASSETS.items() if k != "music")
+        self.bg_levels = (
+            self.resources.load_image("bg_level_1", ASSETS["background_level_1"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE, alpha=False),
+            self.resources.load_image("bg_level_2", ASSETS["background_level_2"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE, alpha=False),
+            self.resources.load_image("bg_level_3", ASSETS["background_level_3"], (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE, alpha=False),
+        )
         self.bg_menu = self.resources.load_image(
             "bg_menu", ASSETS["background_menu"],
-            (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE
+            (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE, alpha=False
         )
         self.bg_endgame = self.resources.load_image(
             "bg_endgame", ASSETS["endgame_bg"],
-            (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE
+            (self.config.WIDTH, self.config.HEIGHT), Colors.WHITE, alpha=False
         )
 
         self.player_idle = self.resources.load_image(
@@ -638,6 +1066,12 @@ class SpaceAtaque:
         self.sound_load_levels = self.resources.load_sound("load_levels", ASSETS["load_levels"]) 
         self.sound_boss_explosion = self.resources.load_sound("boss_explosion", ASSETS["boss_explosion"]) 
         self.sound_pause_game = self.resources.load_sound("pause_game", ASSETS["pause_game"]) 
+
+        # play() dos sons frequentes resolvido uma vez (no-op quando o som não carregou).
+        # Ponto e dano podem disparar várias vezes no mesmo quadro: no máximo uma a cada 40 ms
+        self._play_point = _throttled_play(self.sound_point.play, 40) if self.sound_point else _noop
+        self._play_hit = _throttled_play(self.sound_hit.play, 40) if self.sound_hit else _noop
+        self._play_shoot = self.sound_shoot.play if self.sound_shoot else _noop
         self.sound_space_bridge = self.resources.load_sound("space_bridge", ASSETS["space_bridge"]) 
         
         try:
@@ -649,8 +1083,9 @@ class SpaceAtaque:
         self.explosion_frames: List[pygame.Surface] = []
         try:
             sheet_path = self.resources._resolve_path(ASSETS["explosion_sheet"])
-            if os.path.exists(sheet_path):
-                sheet = pygame.image.load(sheet_path).convert_alpha()
+            if self.resources._exists(sheet_path):
+                sheet = self.resources.load_surface(sheet_path).convert_alpha()
+                # Os frames são subsuperfícies: compartilham os pixels da folha, sem cópia
                 sheet_w, sheet_h = sheet.get_width(), sheet.get_height()
                 cols = 8
                 rows = 8
@@ -659,7 +1094,7 @@ class SpaceAtaque:
                 for r in range(rows):
                     for c in range(cols):
                         rect = pygame.Rect(c * cell_w, r * cell_h, cell_w, cell_h)
-                        frame = sheet.subsurface(rect).copy()
+                        frame = sheet.subsurface(rect)
                         self.explosion_frames.append(frame)
         except Exception as e:
             print(f"Aviso: falha ao carregar frames de explosão: {e}")
@@ -669,52 +1104,36 @@ class SpaceAtaque:
         except Exception as e:
             print(f"Aviso: falha ao aplicar volumes: {e}")
 
-        self.enemy_3_2_explosion_frames: List[pygame.Surface] = []
-        try:
-            dir_path = self.resources._resolve_path("Assets/Enemies/enemy_3_2_explosion")
-            if os.path.isdir(dir_path):
-                for fname in sorted(os.listdir(dir_path)):
-                    if fname.lower().endswith((".png", ".jpg", ".jpeg")):
-                        fpath = os.path.join(dir_path, fname)
-                        try:
-                            img = pygame.image.load(fpath).convert_alpha()
-                            self.enemy_3_2_explosion_frames.append(img)
-                        except Exception as e:
-                            print(f"Aviso: falha ao carregar frame enemy_level3_2 '{fname}': {e}")
-        except Exception as e:
-            print(f"Aviso: falha ao listar frames enemy_3_2_Explosion: {e}")
-
-        self.enemy_1_explosion_frames: List[pygame.Surface] = []
-        try:
-            dir_path = self.resources._resolve_path("Assets/Enemies/enemy_1_explosion")
-            if os.path.isdir(dir_path):
-                for fname in sorted(os.listdir(dir_path)):
-                    if fname.lower().endswith((".png", ".jpg", ".jpeg")):
-                        fpath = os.path.join(dir_path, fname)
-                        try:
-                            img = pygame.image.load(fpath).convert_alpha()
-                            self.enemy_1_explosion_frames.append(img)
-                        except Exception as e:
-                            print(f"Aviso: falha ao carregar frame enemy_1 '{fname}': {e}")
-        except Exception as e:
-            print(f"Aviso: falha ao listar frames enemy_1_Explosion: {e}")
+        self.enemy_3_2_explosion_frames = self.resources.load_frames("Assets/Enemies/enemy_3_2_explosion")
+        self.enemy_1_explosion_frames = self.resources.load_frames("Assets/Enemies/enemy_1_explosion")
+        self.enemy_2_explosion_frames = self.resources.load_frames("Assets/Enemies/enemy_2_explosion")
 
-        self.enemy_2_explosion_frames: List[pygame.Surface] = []
-        try:
-            dir_path = self.resources._resolve_path("Assets/Enemies/enemy_2_explosion")
-            if os.path.isdir(dir_path):
-                for fname in sorted(os.listdir(dir_path)):
-                    if fname.lower().endswith((".png", ".jpg", ".jpeg")):
-                        fpath = os.path.join(dir_path, fname)
-                        try:
-                            img = pygame.image.load(fpath).convert_alpha()
-                            self.enemy_2_explosion_frames.append(img)
-                        except Exception as e:
-                            print(f"Aviso: falha ao carregar frame enemy_2 '{fname}': {e}")
-        except Exception as e:
-            print(f"Aviso: falha ao listar frames enemy_2_Explosion: {e}")
+        # Sprites de inimigos por fase (tuplas fixas, montadas uma única vez)
+        self._enemy_imgs_by_phase = (
+            (self.enemy_level1_img,),
+            (self.enemy_level2_img,),
+            (self.enemy_level3_img, self.enemy_level3_2_img),
+        )
 
-    def _apply_volumes(self):
+        # Sprite do inimigo -> frames da sua explosão (uma busca por abate)
+        self._explosion_frames_by_enemy_img: Dict[pygame.Surface, List[pygame.Surface]] = {}
+        for img, frames in (
+            (self.enemy_level1_img, self.enemy_1_explosion_frames),
+            (self.enemy_level2_img, self.enemy_2_explosion_frames),
+            (self.enemy_level3_2_img, self.enemy_3_2_explosion_frames),
+        ):
+            if frames:
+                self._explosion_frames_by_enemy_img[img] = frames
+
+        # Redimensiona todas as explosões já no carregamento (sem travada no primeiro abate)
+        for frames in (*self._explosion_frames_by_enemy_img.values(), self.explosion_frames):
+            Explosion.scaled_frames(frames, Sizes.EXPLOSION)
+
+    def _apply_volumes(self, only: Optional[str] = None):
+        """Aplica volumes aos sons. only="music" atualiza só a trilha e os loops ligados a ela;
+        only="point"/"hit"/"shoot" atualiza só os efeitos (que derivam desses três volumes)."""
+        do_sfx = only != "music"
+        do_music = only is None or only == "music"
         point_vol = self.volumes.get("point", 0.0) if self.sound_enabled.get("point", True) else 0.0
         hit_vol = self.volumes.get("hit", 0.0) if self.sound_enabled.get("hit", True) else 0.0
         shoot_vol = self.volumes.get("shoot", 0.0) if self.sound_enabled.get("shoot", True) else 0.0
@@ -769,30 +1188,33 @@ class SpaceAtaque:
             except Exception:
                 pass
 
-        if hasattr(self, "sound_point") and self.sound_point:
+        if only in (None, "point") and hasattr(self, "sound_point") and self.sound_point:
             try:
                 self.sound_point.set_volume(point_vol)
             except Exception:
                 pass
-        if hasattr(self, "sound_hit") and self.sound_hit:
+        if only in (None, "hit") and hasattr(self, "sound_hit") and self.sound_hit:
             try:
                 self.sound_hit.set_volume(hit_vol)
             except Exception:
                 pass
-        if hasattr(self, "sound_shoot") and self.sound_shoot:
+        if only in (None, "shoot") and hasattr(self, "sound_shoot") and self.sound_shoot:
             try:
                 self.sound_shoot.set_volume(shoot_vol)
             except Exception:
                 pass
 
-        _apply_sound_with_boost("sound_low_lifes", sfx_vol, apply_duck=True, chan_attr="_chan_low_lifes")
-        boss_base = sfx_vol if sfx_vol > 0.0 else sfx_vol_any
-        _apply_sound_with_boost("sound_boss_final", boss_base, apply_duck=True, chan_attr="_chan_boss_final")
-        collect_base = sfx_vol if sfx_vol > 0.0 else sfx_vol_any
-        _apply_sound_with_boost("sound_collect_star", collect_base, apply_duck=True)
-        _apply_sound_with_boost("sound_gameover", sfx_vol, apply_duck=True)
-        _apply_sound_with_boost("sound_boss_explosion", boss_base, apply_duck=True)
-        _apply_sound_with_boost("sound_pause_game", sfx_vol, apply_duck=True, chan_attr="_chan_pause")
+        if do_sfx:
+            _apply_sound_with_boost("sound_low_lifes", sfx_vol, apply_duck=True, chan_attr="_chan_low_lifes")
+            boss_base = sfx_vol if sfx_vol > 0.0 else sfx_vol_any
+            _apply_sound_with_boost("sound_boss_final", boss_base, apply_duck=True, chan_attr="_chan_boss_final")
+            collect_base = sfx_vol if sfx_vol > 0.0 else sfx_vol_any
+            _apply_sound_with_boost("sound_collect_star", collect_base, apply_duck=True)
+            _apply_sound_with_boost("sound_gameover", sfx_vol, apply_duck=True)
+            _apply_sound_with_boost("sound_boss_explosion", boss_base, apply_duck=True)
+            _apply_sound_with_boost("sound_pause_game", sfx_vol, apply_duck=True, chan_attr="_chan_pause")
+        if not do_music:
+            return
         _apply_sound_with_boost("sound_space_bridge", music_base_vol, apply_duck=True, chan_attr="_chan_space_bridge", apply_boost=False)
         _apply_sound_with_boost("sound_load_levels", music_base_vol, apply_duck=False, chan_attr="_chan_phase_wait", apply_boost=False)
 
@@ -873,12 +1295,13 @@ class SpaceAtaque:
         except Exception:
             pass
 
-    def _update_dynamic_sounds(self):
+    def _update_dynamic_sounds(self, now_ms: Optional[int] = None):
         if self.state == GameState.PLAYING and self.lives <= 3:
             self._start_loop("sound_low_lifes", "_low_lifes_playing", "_chan_low_lifes", bypass_flags=True, use_any_base=True)
         else:
             self._stop_loop("_low_lifes_playing", "_chan_low_lifes")
-        if self._boss_final_end_ms is not None and pygame.time.get_ticks() >= self._boss_final_end_ms:
+        now = now_ms if now_ms is not None else pygame.time.get_ticks()
+        if self._boss_final_end_ms is not None and now >= self._boss_final_end_ms:
             try:
                 if self._chan_boss_final:
                     self._chan_boss_final.stop()
@@ -893,48 +1316,47 @@ class SpaceAtaque:
             raise ValueError(f"Nome de volume inválido: {name}. Válidos: {sorted(allowed)}")
         v = _normalize_volume_value(value)
         self.volumes[name] = v
-        self._apply_volumes()
+        self._apply_volumes(only=name)
 
-    def _get_enemy_images_for_phase(self) -> List[pygame.Surface]:
-        """Retorna a lista de sprites de inimigos conforme a fase atual.
+    def _get_enemy_images_for_phase(self) -> Tuple[pygame.Surface, ...]:
+        """Retorna os sprites de inimigos conforme a fase atual.
         Fase 1 (phase==0): enemy_level1
         Fase 2 (phase==1): enemy_level2
         Fase 3+ (phase>=2): inimigos aleatórios entre enemy_level3 e enemy_level3_2
         """
-        if self.phase == 0:
-            return [self.enemy_level1_img]
-        elif self.phase == 1:
-            return [self.enemy_level2_img]
-        else:
-            return [self.enemy_level3_img, self.enemy_level3_2_img]
+        return self._enemy_imgs_by_phase[min(self.phase, 2)]
+
+    def _phase_config(self) -> DifficultyConfig:
+        """Configuração da dificuldade atual escalada para a fase (recalculada só quando mudam)"""
+        key = (self.difficulty, self.phase)
+        if self._phase_cfg_key != key:
+            self._phase_cfg = DIFFICULTIES[self.difficulty].scale_for_phase(self.phase)
+            self._phase_cfg_key = key
+        return self._phase_cfg
 
     def _create_enemies(self, config: DifficultyConfig):
         """Cria naves inimigas e os ADICIONA AOS GRUPOS"""
-        for _ in range(config.enemies):
-            x = self._rand_x_avoiding_boss_column(Sizes.ENEMY[0])
-            y = random.randint(-500, -40)
-            speed = random.randint(config.speed_min, config.speed_max)
-            enemy_imgs = self._get_enemy_images_for_phase()
-            img = random.choice(enemy_imgs)
-
-            enemy = Enemy(x, y, speed, img)
-
-            self.all_sprites.add(enemy)
-            self.enemy_group.add(enemy)
+        enemy_imgs = self._get_enemy_images_for_phase()
+        randint, choice = random.randint, random.choice
+        enemies = [
+            Enemy(self._rand_x_avoiding_boss_column(Sizes.ENEMY[0]),
+                  randint(-500, -40),
+                  randint(config.speed_min, config.speed_max),
+                  choice(enemy_imgs))
+            for _ in range(config.enemies)
+        ]
+        # Uma chamada add por grupo para a leva inteira
+        self.all_sprites.add(enemies)
+        self.enemy_group.add(enemies)
 
     def _clear_game_groups(self):
-        """Limpa todos os sprites do jogo (exceto o jogador)."""
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.shield_group.empty()
-        self.bullet_group.empty()
-        self.explosion_group.empty()
-        self.boss_group.empty()
-        self.all_sprites.empty()
-        if hasattr(self, 'shield_aura_group'):
-            self.shield_aura_group.empty()
+        """Limpa todos os sprites do jogo e devolve o(s) jogador(es) ao all_sprites."""
+        for group in self._game_groups:
+            group.empty()
         if self.player:
             self.all_sprites.add(self.player)
+        if self.multiplayer and self.player2:
+            self.all_sprites.add(self.player2)
 
     def new_game(self):
         """Inicia um novo jogo (single-player)"""
@@ -948,7 +1370,6 @@ class SpaceAtaque:
         self.boss_defeated = False
         self.boss_spawned = False
         self.boss_hp = 0.0
-        self.boss_group.empty()
         self.next_item_spawn_score = None
         self.next_shield_spawn_score = None
         self.invulnerable_until_ms = 0
@@ -966,17 +1387,9 @@ class SpaceAtaque:
             self.player.reset_position(self.config.WIDTH // 2, self.config.HEIGHT - 60)
 
         self.player_group.add(self.player)
-        self.all_sprites.add(self.player)
-
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.shield_group.empty()
-        self.bullet_group.empty()
-        self.explosion_group.empty()
-        if hasattr(self, 'shield_aura_group'):
-            self.shield_aura_group.empty()
+        self._clear_game_groups()
 
-        self._create_enemies(diff_config.scale_for_phase(0))
+        self._create_enemies(self._phase_config())
 
         self._reset_item_spawn_schedule()
         self._reset_shield_spawn_schedule()
@@ -993,7 +1406,6 @@ class SpaceAtaque:
         self.boss_defeated = False
         self.boss_spawned = False
         self.boss_hp = 0.0
-        self.boss_group.empty()
         self.next_item_spawn_score = None
         self.next_shield_spawn_score = None
         self.invulnerable_until_ms = 0
@@ -1010,18 +1422,9 @@ class SpaceAtaque:
             self.player_idle, self.player_up, control_scheme="wasd"
         )
 
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.shield_group.empty()
-        self.bullet_group.empty()
-        self.explosion_group.empty()
-        if hasattr(self, 'shield_aura_group'):
-            self.shield_aura_group.empty()
-        self.all_sprites.empty()
-        self.all_sprites.add(self.player)
-        self.all_sprites.add(self.player2)
+        self._clear_game_groups()
 
-        self._create_enemies(diff_config.scale_for_phase(0))
+        self._create_enemies(self._phase_config())
 
         self._reset_item_spawn_schedule()
         self._reset_shield_spawn_schedule()
@@ -1058,7 +1461,6 @@ class SpaceAtaque:
 
         self.boss_spawned = False
         self.boss_hp = 0.0
-        self.boss_group.empty()
 
         self.next_item_spawn_score = None
         self.next_shield_spawn_score = None
@@ -1077,18 +1479,9 @@ class SpaceAtaque:
             self.player.rect.y = player_data.get("y", self.player.rect.y)
 
         self.player_group.add(self.player)
-        self.all_sprites.add(self.player)
+        self._clear_game_groups()
 
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.shield_group.empty()
-        self.bullet_group.empty()
-        self.explosion_group.empty()
-        if hasattr(self, 'shield_aura_group'):
-            self.shield_aura_group.empty()
-
-        diff_config = DIFFICULTIES[self.difficulty]
-        self._create_enemies(diff_config.scale_for_phase(self.phase))
+        self._create_enemies(self._phase_config())
 
         self._reset_item_spawn_schedule()
         self._reset_shield_spawn_schedule()
@@ -1101,18 +1494,11 @@ class SpaceAtaque:
         Fase 2: 250+ pontos
         Fase 3+: 350+ pontos
         """
-        if self.phase == 0:
-            return 100
-        elif self.phase == 1:
-            return 250
-        else:
-            return 350
+        return self.PHASE_TARGETS[min(self.phase, 2)]
 
     def _get_phase_required_items(self) -> int:
         """Quantidade de itens necessários para a fase atual (F2 e F3 requerem 3)"""
-        if self.phase >= 1:
-            return 3
-        return 0
+        return self.PHASE_REQUIRED_ITEMS[min(self.phase, 2)]
 
     def _is_boss_required(self) -> bool:
         """Indica se a fase atual requer derrotar chefe (Fase 3 em diante)"""
@@ -1131,12 +1517,7 @@ class SpaceAtaque:
     def _get_bg_for_current_phase(self) -> pygame.Surface:
         """Retorna o background correspondente à fase atual.
         Mapeamento: fase 1->bg1, fase 2->bg2, fase 3+->bg3."""
-        idx = 0
-        if self.phase >= 2:
-            idx = 2
-        elif self.phase == 1:
-            idx = 1
-        return self.bg_levels[idx]
+        return self.bg_levels[min(self.phase, 2)]
 
     # =============================
     # Itens coletáveis - Fase 2 e 3
@@ -1145,7 +1526,7 @@ class SpaceAtaque:
         return self.phase >= 1
 
     def _item_speed_for_phase(self) -> int:
-        return 7 if self.phase == 1 else 8
+        return self.PHASE_ITEM_SPEEDS[min(self.phase, 2)]
 
     def _reset_item_spawn_schedule(self):
         if self._is_item_enabled():
@@ -1184,13 +1565,12 @@ class SpaceAtaque:
         """Processa colisão com naves inimigas"""
         self.lives -= 1
 
-        if 0 < self.score < 50:
-            self.score = max(0, self.score - 2)
-        elif self.score >= 50:
-            self.score = max(0, self.score - 5)
+        # Penalidade: 2 pontos abaixo de 50, 5 a partir de 50, nada com placar zerado
+        score = self.score
+        penalty = (2 + 3 * (score >= 50)) * (score > 0)
+        self.score = max(0, score - penalty)
 
-        if self.sound_hit:
-            self.sound_hit.play()
+        self._play_hit()
 
     def _advance_phase(self):
         """Avança para a próxima fase"""
@@ -1209,18 +1589,7 @@ class SpaceAtaque:
         self.boss_spawned = False
         self.boss_hp = 0.0
 
-        self.enemy_group.empty()
-        self.item_group.empty()
-        self.shield_group.empty()
-        self.bullet_group.empty()
-        self.explosion_group.empty()
-        self.boss_group.empty()
-
-        self.all_sprites.empty()
-        if self.player:
-            self.all_sprites.add(self.player)
-        if self.multiplayer and getattr(self, 'player2', None):
-            self.all_sprites.add(self.player2)
+        self._clear_game_groups()
 
         self._reset_item_spawn_schedule()
         self._reset_shield_spawn_schedule()
@@ -1234,37 +1603,48 @@ class SpaceAtaque:
         if self.multiplayer and getattr(self, 'player2', None):
             self.player.reset_position(self.config.WIDTH // 3, self.config.HEIGHT - 60)
             self.player2.reset_position((self.config.WIDTH * 2) // 3, self.config.HEIGHT - 60)
-        diff_config = DIFFICULTIES[self.difficulty]
-        self._create_enemies(diff_config.scale_for_phase(self.phase))
+        self._create_enemies(self._phase_config())
 
         self.state = GameState.PLAYING
         self.phase_victory_end = None
+        self._phase_victory_dirty = False
 
-    def _try_shoot(self, keys):
+    def _try_shoot(self, keys, now: int):
         """Dispara projétil se Espaço estiver pressionado."""
         if not self.player:
             return
         if not keys[pygame.K_SPACE]:
             return
-        now = pygame.time.get_ticks()
         if now - self.last_shot_ms < Sizes.FIRE_COOLDOWN_MS:
             return
 
         bx = self.player.rect.centerx - Sizes.BULLET[0] // 2
         by = self.player.rect.top - Sizes.BULLET[1]
 
-        bullet = Bullet(bx, by)
+        bullet = Bullet.acquire(bx, by)
 
         self.all_sprites.add(bullet)
         self.bullet_group.add(bullet)
 
         self.last_shot_ms = now
 
-        if hasattr(self, "sound_shoot") and self.sound_shoot:
-            try:
-                self.sound_shoot.play()
-            except Exception as e:
-                print(f"Aviso: falha ao tocar som de tiro: {e}")
+        self._play_shoot()
+
+    def _collide_bullets_with_enemies(self) -> Dict[Bullet, List[Enemy]]:
+        """Equivalente a groupcollide(bullets, enemies, True, True), mas cada projétil
+        só testa os inimigos das células da grade espacial que ele ocupa."""
+        if not self.bullet_group or not self.enemy_group:
+            return {}
+        self._enemy_grid.build(self.enemy_group.sprites())
+        hits = {}
+        for bullet in self.bullet_group.sprites():
+            victims = [e for e in self._enemy_grid.query(bullet.rect) if e.alive()]
+            if victims:
+                for enemy in victims:
+                    enemy.kill()
+                bullet.kill()
+                hits[bullet] = victims
+        return hits
 
     def _spawn_boss_if_ready(self):
         """Spawna o boss na fase 3+ quando objetivos base (pontos/itens) estiverem completos."""
@@ -1364,77 +1744,81 @@ class SpaceAtaque:
         self.boss.rect = self.boss.image.get_rect()
         self.boss.rect.midtop = prev_midtop
 
-    def _draw_boss_health_bar(self):
+    def _draw_boss_health_bar(self) -> List[pygame.Rect]:
+        """Desenha a barra de vida do chefe e retorna as áreas alteradas."""
         if not self.boss_spawned or not self.boss or self.boss_defeated:
-            return
+            return []
         bar_width = self.boss.rect.width
         bar_height = 10
         x = self.boss.rect.left
         y = self.boss.rect.top - bar_height - 6
-        pygame.draw.rect(self.screen, (50,50,50), (x, y, bar_width, bar_height))
+        bar_rect = pygame.draw.rect(self.screen, (50,50,50), (x, y, bar_width, bar_height))
         pct = max(0.0, min(100.0, self.boss_hp))
         fill_w = int(bar_width * (pct / 100.0))
         color = (0, 200, 0) if pct > 50 else (220, 180, 0) if pct > 20 else (200, 50, 50)
         pygame.draw.rect(self.screen, color, (x, y, fill_w, bar_height))
         txt = self.font_tiny.render(f"{pct:.0f}%", True, Colors.WHITE)
-        self.screen.blit(txt, (x + bar_width//2 - txt.get_width()//2, y - 2 - txt.get_height()))
+        txt_rect = self.screen.blit(txt, (x + bar_width//2 - txt.get_width()//2, y - 2 - txt.get_height()))
+        return [bar_rect, txt_rect]
 
     def update_gameplay(self):
         """Atualiza lógica do gameplay usando grupos de sprites"""
         keys = pygame.key.get_pressed()
+        # Um único relógio por quadro, repassado a quem depende de tempo
+        now_ms = pygame.time.get_ticks()
+        # Consultas repetidas ao longo do quadro resolvidas uma vez em variáveis locais
+        width, height = self.config.WIDTH, self.config.HEIGHT
+        player2 = self.player2 if self.multiplayer else None
+        randint = random.randint
 
-        if self.multiplayer and getattr(self, 'player2', None):
-            self.player.update(keys, self.config.WIDTH, self.config.HEIGHT)
-            self.player2.update(keys, self.config.WIDTH, self.config.HEIGHT)
-        else:
-            self.player.update(keys, self.config.WIDTH, self.config.HEIGHT)
+        self.player.update(keys, width, height)
+        if player2:
+            player2.update(keys, width, height)
 
-        if self.multiplayer and getattr(self, 'player2', None):
-            now = pygame.time.get_ticks()
+        if player2:
+            now = now_ms
             if now - self.last_shot_ms_p1 >= Sizes.FIRE_COOLDOWN_MS:
                 bx = self.player.rect.centerx - Sizes.BULLET[0] // 2
                 by = self.player.rect.top - Sizes.BULLET[1]
-                bullet = Bullet(bx, by)
+                bullet = Bullet.acquire(bx, by)
                 self.all_sprites.add(bullet)
                 self.bullet_group.add(bullet)
                 self.last_shot_ms_p1 = now
-                if hasattr(self, "sound_shoot") and self.sound_shoot:
-                    try:
-                        self.sound_shoot.play()
-                    except Exception:
-                        pass
+                self._play_shoot()
             if now - self.last_shot_ms_p2 >= Sizes.FIRE_COOLDOWN_MS:
-                bx = self.player2.rect.centerx - Sizes.BULLET[0] // 2
-                by = self.player2.rect.top - Sizes.BULLET[1]
-                bullet = Bullet(bx, by)
+                bx = player2.rect.centerx - Sizes.BULLET[0] // 2
+                by = player2.rect.top - Sizes.BULLET[1]
+                bullet = Bullet.acquire(bx, by)
                 self.all_sprites.add(bullet)
                 self.bullet_group.add(bullet)
                 self.last_shot_ms_p2 = now
-                if hasattr(self, "sound_shoot") and self.sound_shoot:
-                    try:
-                        self.sound_shoot.play()
-                    except Exception:
-                        pass
+                self._play_shoot()
         else:
-            self._try_shoot(keys)
+            self._try_shoot(keys, now_ms)
 
+        # Grupos vazios (caso comum para itens, escudo, explosões e chefe) não são percorridos
         self.enemy_group.update()
-        self.item_group.update()
-        self.shield_group.update()
-        self.bullet_group.update()
-        self.explosion_group.update()
-        self.boss_group.update()
+        if self.item_group:
+            self.item_group.update()
+        if self.shield_group:
+            self.shield_group.update()
+        if self.bullet_group:
+            self.bullet_group.update()
+        if self.explosion_group:
+            self.explosion_group.update()
+        if self.boss_group:
+            self.boss_group.update()
 
         self._spawn_boss_if_ready()
         try:
-            self._update_dynamic_sounds()
+            self._update_dynamic_sounds(now_ms)
         except Exception:
             pass
 
-        diff_config = DIFFICULTIES[self.difficulty].scale_for_phase(self.phase)
+        diff_config = self._phase_config()
+        speed_min, speed_max = diff_config.speed_min, diff_config.speed_max
 
         aura_active = hasattr(self, 'shield_aura_group') and getattr(self, 'shield_aura_group', None) is not None and len(self.shield_aura_group) > 0
-        now_ms = pygame.time.get_ticks()
         inv_active = now_ms < self.invulnerable_until_ms
         owner = getattr(self, 'aura_owner', self.player)
         if inv_active and not aura_active and owner is not None:
@@ -1454,18 +1838,28 @@ class SpaceAtaque:
             except Exception:
                 pass
         if hasattr(self, 'shield_aura_group') and self.shield_aura_group:
-            self.shield_aura_group.update()
+            self.shield_aura_group.update(now_ms)
+
+        # Corte vertical: só inimigos que já alcançaram a faixa dos jogadores podem colidir.
+        # Os restantes passam por um único teste AABB em C (collidelistall) por jogador
+        cull_top = self.player.rect.top
+        if player2:
+            cull_top = min(cull_top, player2.rect.top)
+        enemies = [e for e in self.enemy_group if e.rect.bottom > cull_top]
+        enemy_rects = [e.rect for e in enemies]
 
         def process_player_enemy_collisions(plyr):
-            hits_local = pygame.sprite.spritecollide(plyr, self.enemy_group, False)
-            if hits_local:
-                now_loc = pygame.time.get_ticks()
-                inv_loc = now_loc < self.invulnerable_until_ms
-                for enemy_hit in hits_local:
+            if not enemies:
+                return False
+            hit_indices = plyr.rect.collidelistall(enemy_rects)
+            if hit_indices:
+                inv_loc = now_ms < self.invulnerable_until_ms
+                for i in hit_indices:
+                    enemy_hit = enemies[i]
                     if not inv_loc:
                         self._handle_enemy_collision()
                     enemy_hit.randomize_position()
-                    enemy_hit.speed = random.randint(diff_config.speed_min, diff_config.speed_max)
+                    enemy_hit.speed = randint(speed_min, speed_max)
                 if self.lives <= 0 and not inv_loc:
                     self.state = GameState.GAME_OVER
                     return True
@@ -1473,41 +1867,35 @@ class SpaceAtaque:
 
         if process_player_enemy_collisions(self.player):
             return
-        if self.multiplayer and getattr(self, 'player2', None):
-            if process_player_enemy_collisions(self.player2):
+        if player2:
+            if process_player_enemy_collisions(player2):
                 return
 
-        hits = pygame.sprite.groupcollide(self.bullet_group, self.enemy_group, True, True)
+        hits = self._collide_bullets_with_enemies()
         if hits:
+            # Explosões e inimigos de reposição são acumulados e adicionados aos grupos de uma vez
+            new_explosions = []
+            new_enemies = []
+            enemy_imgs = self._get_enemy_images_for_phase()
             for enemy_list in hits.values():
                 for enemy in enemy_list:
-                    frames_to_use = None
-                    try:
-                        if enemy.image == self.enemy_level3_2_img and hasattr(self, "enemy_3_2_explosion_frames") and self.enemy_3_2_explosion_frames:
-                            frames_to_use = self.enemy_3_2_explosion_frames
-                        elif enemy.image == self.enemy_level1_img and hasattr(self, "enemy_1_explosion_frames") and self.enemy_1_explosion_frames:
-                            frames_to_use = self.enemy_1_explosion_frames
-                        elif enemy.image == self.enemy_level2_img and hasattr(self, "enemy_2_explosion_frames") and self.enemy_2_explosion_frames:
-                            frames_to_use = self.enemy_2_explosion_frames
-                    except Exception:
-                        frames_to_use = None
+                    frames_to_use = self._explosion_frames_by_enemy_img.get(enemy.image)
                     if not frames_to_use and hasattr(self, "explosion_frames") and self.explosion_frames:
                         frames_to_use = self.explosion_frames
                     if frames_to_use:
-                        exp = Explosion(enemy.rect.center, frames_to_use, frame_time_ms=40, scale=(80, 80))
-                        self.explosion_group.add(exp)
+                        new_explosions.append(Explosion(enemy.rect.center, frames_to_use, frame_time_ms=40, scale=Sizes.EXPLOSION))
                     self.score += 1
-                    if self.sound_point:
-                        self.sound_point.play()
+                    self._play_point()
 
                     x = self._rand_x_avoiding_boss_column(Sizes.ENEMY[0])
-                    y = random.randint(-100, -40)
-                    speed = random.randint(diff_config.speed_min, diff_config.speed_max)
-                    enemy_imgs = self._get_enemy_images_for_phase()
+                    y = randint(-100, -40)
+                    speed = randint(speed_min, speed_max)
                     img = random.choice(enemy_imgs)
-                    new_enemy = Enemy(x, y, speed, img)
-                    self.all_sprites.add(new_enemy)
-                    self.enemy_group.add(new_enemy)
+                    new_enemies.append(Enemy(x, y, speed, img))
+            if new_explosions:
+                self.explosion_group.add(new_explosions)
+            self.all_sprites.add(new_enemies)
+            self.enemy_group.add(new_enemies)
 
         if self.boss_spawned and not self.boss_defeated:
             boss_hits = pygame.sprite.groupcollide(self.bullet_group, self.boss_group, True, False)
@@ -1575,24 +1963,26 @@ class SpaceAtaque:
                         except Exception:
                             pass
                         snd.play()
-                    elif self.sound_point:
-                        self.sound_point.play()
+                    else:
+                        self._play_point()
                 except Exception:
                     pass
-        process_item_pickups(self.player)
-        if self.multiplayer and getattr(self, 'player2', None):
-            process_item_pickups(self.player2)
+        # No máximo um item/escudo caindo por vez: sem nenhum na tela não há o que testar
+        if self.item_group:
+            process_item_pickups(self.player)
+            if player2:
+                process_item_pickups(player2)
 
         def process_shield_pickups(plyr):
             shield_hits_local = pygame.sprite.spritecollide(plyr, self.shield_group, True)
             if shield_hits_local:
-                self.invulnerable_until_ms = pygame.time.get_ticks() + 5000
+                self.invulnerable_until_ms = now_ms + 5000
                 self.aura_owner = plyr
-                if self.sound_point:
-                    self.sound_point.play()
-        process_shield_pickups(self.player)
-        if self.multiplayer and getattr(self, 'player2', None):
-            process_shield_pickups(self.player2)
+                self._play_point()
+        if self.shield_group:
+            process_shield_pickups(self.player)
+            if player2:
+                process_shield_pickups(player2)
 
         if self._is_item_enabled():
             if self.next_item_spawn_score is None:
@@ -1604,7 +1994,9 @@ class SpaceAtaque:
 
         if self.next_shield_spawn_score is None:
             self._reset_shield_spawn_schedule()
-        if self.next_shield_spawn_score is not None and self.score >= self.next_shield_spawn_score:
+        # Com o escudo ativo o próximo escudo fica pendente e surge quando ele acabar
+        if (self.next_shield_spawn_score is not None and self.score >= self.next_shield_spawn_score
+                and now_ms >= self.invulnerable_until_ms):
             if len(self.shield_group) == 0:
                 self._spawn_shield()
             self.next_shield_spawn_score += 33
@@ -1612,33 +2004,57 @@ class SpaceAtaque:
         if self._has_phase_victory():
             self.state = GameState.PHASE_VICTORY
             self.phase_victory_end = pygame.time.get_ticks() + self.config.PHASE_VICTORY_DURATION
+            self._phase_victory_dirty = True
+            # O SDL acorda o loop só quando a contagem muda e quando a fase deve avançar
+            pygame.time.set_timer(PHASE_COUNTDOWN_EVENT, 1000)
+            pygame.time.set_timer(PHASE_ADVANCE_EVENT, self.config.PHASE_VICTORY_DURATION, loops=1)
+
+    def draw_gameplay(self, full_redraw: bool = True) -> Optional[List[pygame.Rect]]:
+        """Desenha o gameplay.
+        Com full_redraw=False restaura o fundo apenas sob o que foi desenhado no quadro
+        anterior e retorna as áreas alteradas para pygame.display.update; caso contrário
+        redesenha a tela inteira e retorna None."""
+        bg = self._get_bg_for_current_phase()
+        if full_redraw:
+            self.screen.blit(bg, (0, 0))
+        else:
+            # Uma única chamada em C para restaurar todos os recortes do fundo
+            self.screen.blits([(bg, r, r) for r in self._prev_draw_rects], doreturn=False)
 
-    def draw_gameplay(self):
-        """Desenha o gameplay"""
-        self.screen.blit(self._get_bg_for_current_phase(), (0, 0))
-
+        drawn: List[pygame.Rect] = []
         self.all_sprites.draw(self.screen)
+        drawn.extend(self.all_sprites.spritedict.values())
         if hasattr(self, 'shield_aura_group') and self.shield_aura_group:
             self.shield_aura_group.draw(self.screen)
-        self.explosion_group.draw(self.screen)
-        self._draw_boss_health_bar()
+            drawn.extend(self.shield_aura_group.spritedict.values())
+        if self.explosion_group:
+            self.explosion_group.draw(self.screen)
+            drawn.extend(self.explosion_group.spritedict.values())
+        drawn.extend(self._draw_boss_health_bar())
+
+        hud_key = (self.score, self.lives, self.phase, self.items_collected, self.boss_defeated)
+        if hud_key != self._hud_key:
+            self._hud_surf = self.font_tiny.render(
+                f"Pontos: {self.score}   Vidas: {self.lives}   Fase: {self.phase + 1}",
+                True, Colors.WHITE
+            )
 
-        hud_text = self.font_tiny.render(
-            f"Pontos: {self.score}   Vidas: {self.lives}   Fase: {self.phase + 1}",
-            True, Colors.WHITE
-        )
-        self.screen.blit(hud_text, (10, 10))
-
-        target_pts = self._get_phase_target()
-        req_items = self._get_phase_required_items()
-        boss_req = self._is_boss_required()
-        obj_parts = [f"Objetivo: {self.score}/{target_pts} pts"]
-        if req_items > 0:
-            obj_parts.append(f"Itens: {self.items_collected}/{req_items}")
-        if boss_req:
-            obj_parts.append(f"Chefe: {'Derrotado' if self.boss_defeated else 'Não'}")
-        hud2_text = self.font_tiny.render("  •  ".join(obj_parts), True, Colors.WHITE)
-        self.screen.blit(hud2_text, (10, 40))
+            target_pts = self._get_phase_target()
+            req_items = self._get_phase_required_items()
+            boss_req = self._is_boss_required()
+            obj_parts = [f"Objetivo: {self.score}/{target_pts} pts"]
+            if req_items > 0:
+                obj_parts.append(f"Itens: {self.items_collected}/{req_items}")
+            if boss_req:
+                obj_parts.append(f"Chefe: {'Derrotado' if self.boss_defeated else 'Não'}")
+            self._hud_obj_surf = self.font_tiny.render("  •  ".join(obj_parts), True, Colors.WHITE)
+            self._hud_key = hud_key
+        drawn.append(self.screen.blit(self._hud_surf, (10, 10)))
+        drawn.append(self.screen.blit(self._hud_obj_surf, (10, 40)))
+
+        dirty = None if full_redraw else self._prev_draw_rects + drawn
+        self._prev_draw_rects = drawn
+        return dirty
 
     def draw_phase_victory(self):
         """Desenha tela de vitória da fase"""
@@ -1652,16 +2068,20 @@ class SpaceAtaque:
         except Exception:
             pass
 
-        title = self.font_large.render("Fase vencida!", True, Colors.YELLOW)
-        phase_label = self.font_small.render(
-            f"Fase {self.phase + 1} concluída!", True, Colors.WHITE
-        )
+        title = self._phase_victory_title
+        if self._phase_label_cache[0] != self.phase:
+            self._phase_label_cache = (self.phase, self.font_small.render(
+                f"Fase {self.phase + 1} concluída!", True, Colors.WHITE
+            ))
+        phase_label = self._phase_label_cache[1]
 
         remaining_ms = max(0, self.phase_victory_end - pygame.time.get_ticks())
         remaining_sec = (remaining_ms // 1000) + (1 if remaining_ms % 1000 > 0 else 0)
-        timer_text = self.font_small.render(
-            f"Próxima fase em {remaining_sec}s...", True, Colors.WHITE
-        )
+        if self._timer_text_cache[0] != remaining_sec:
+            self._timer_text_cache = (remaining_sec, self.font_small.render(
+                f"Próxima fase em {remaining_sec}s...", True, Colors.WHITE
+            ))
+        timer_text = self._timer_text_cache[1]
 
         self.screen.blit(title,
                          (self.config.WIDTH // 2 - title.get_width() // 2, 180))
@@ -1670,8 +2090,14 @@ class SpaceAtaque:
         self.screen.blit(timer_text,
                          (self.config.WIDTH // 2 - timer_text.get_width() // 2, 320))
 
-        if pygame.time.get_ticks() >= self.phase_victory_end:
-            self._advance_phase()
+    def _wait_menu_events(self, timeout_ms: int = 0) -> List[pygame.event.Event]:
+        """Dorme no SDL até chegar um evento (ou até timeout_ms, se > 0) e retorna os
+        eventos de menu pendentes; os demais são descartados."""
+        first = pygame.event.wait(timeout_ms)
+        events = [first] if first.type in MENU_EVENTS else []
+        events.extend(pygame.event.get(MENU_EVENTS))
+        pygame.event.clear(pump=False)
+        return events
 
     def run_pause(self) -> bool:
         """Loop de pausa. Retorna False se deve encerrar o jogo; True caso contrário."""
@@ -1684,28 +2110,37 @@ class SpaceAtaque:
         except Exception:
             pass
 
+        # O mundo não muda durante a pausa: renderiza a cena uma vez e reaproveita a imagem
+        self.draw_gameplay()
+        scene_snapshot = self.screen.copy()
+
+        # Textos fixos da pausa; cada opção em suas duas cores (normal, selecionada)
+        center_x = self.config.WIDTH // 2
+        title = self.font_large.render("JOGO PAUSADO", True, Colors.YELLOW)
+        title_pos = (center_x - title.get_width() // 2, 120)
+        option_labels = []
+        for i, opt in enumerate(options):
+            normal = self.font_small.render(opt, True, Colors.WHITE)
+            highlighted = self.font_small.render(opt, True, Colors.YELLOW)
+            option_labels.append((normal, highlighted, (center_x - normal.get_width() // 2, 240 + i * 60)))
+        hint = self.font_tiny.render("ESC para continuar • ENTER para selecionar", True, Colors.WHITE)
+        hint_pos = (center_x - hint.get_width() // 2, self.config.HEIGHT - 80)
+
         paused = True
         while paused:
-            self.draw_gameplay()
+            self.screen.blit(scene_snapshot, (0, 0))
+            self.screen.blit(self._pause_overlay, (0, 0))
 
-            overlay = pygame.Surface((self.config.WIDTH, self.config.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 160))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(title, title_pos)
 
-            title = self.font_large.render("JOGO PAUSADO", True, Colors.YELLOW)
-            self.screen.blit(title, (self.config.WIDTH // 2 - title.get_width() // 2, 120))
+            for i, (normal, highlighted, pos) in enumerate(option_labels):
+                self.screen.blit(highlighted if i == selected else normal, pos)
 
-            for i, opt in enumerate(options):
-                color = Colors.YELLOW if i == selected else Colors.WHITE
-                label = self.font_small.render(opt, True, color)
-                self.screen.blit(label, (self.config.WIDTH // 2 - label.get_width() // 2, 240 + i * 60))
-
-            hint = self.font_tiny.render("ESC para continuar • ENTER para selecionar", True, Colors.WHITE)
-            self.screen.blit(hint, (self.config.WIDTH // 2 - hint.get_width() // 2, self.config.HEIGHT - 80))
+            self.screen.blit(hint, hint_pos)
 
             pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in self._wait_menu_events():
                 if event.type == pygame.QUIT:
                     try:
                         self._stop_loop("_pause_snd_playing", "_chan_pause")
@@ -1761,53 +2196,73 @@ class SpaceAtaque:
                                 pass
                             return False
 
-            self.clock.tick(self.config.FPS)
-
         return True
 
-    def run_menu(self) -> bool:
-        """Executa menu. Retorna False se deve sair do jogo"""
-        menu_options = ["Novo jogo", "Multiplayer", "Carregar jogo salvo", "Escolher dificuldade", "Configurações", "Sair"]
-        selected = 0
-        message = ""
-        message_timer = 0
-
-        while self.state == GameState.MENU:
-            self.screen.blit(self.bg_menu, (0, 0))
+    def _draw_main_menu(self, menu_options: List[str], selected: int, message: str):
+        """Desenha o menu principal na tela (sem apresentar)"""
+        self.screen.blit(self.bg_menu, (0, 0))
 
-            title = self.font_medium.render("SPACE ATAQUE", True, Colors.YELLOW)
-            self.screen.blit(title, (self.config.WIDTH // 2 - title.get_width() // 2, 80))
+        self.screen.blit(self._menu_title_surf, self._menu_title_pos)
 
-            high = self.save_manager.get_highscore()
-            hs_label = self.font_tiny.render(f"Maior pontuação: {high}", True, Colors.WHITE)
-            self.screen.blit(hs_label, (self.config.WIDTH // 2 - hs_label.get_width() // 2, 150))
+        high = self.save_manager.get_highscore()
+        if self._menu_highscore_cache[0] != high:
+            self._menu_highscore_cache = (high, self.font_tiny.render(f"Maior pontuação: {high}", True, Colors.WHITE))
+        hs_label = self._menu_highscore_cache[1]
+        self.screen.blit(hs_label, (self.config.WIDTH // 2 - hs_label.get_width() // 2, 150))
 
-            start_y = 220
+        start_y = 220
+        if self._menu_option_surfs is None:
+            self._menu_option_surfs = []
             for i, opt in enumerate(menu_options):
-                color = Colors.YELLOW if i == selected else Colors.WHITE
-                label = self.font_tiny.render(opt, True, color)
-                self.screen.blit(label,
-                                 (self.config.WIDTH // 2 - label.get_width() // 2,
-                                  start_y + i * 40))
-
-            diff_text = self.font_tiny.render(
+                normal = self.font_tiny.render(opt, True, Colors.WHITE)
+                highlighted = self.font_tiny.render(opt, True, Colors.YELLOW)
+                pos = (self.config.WIDTH // 2 - normal.get_width() // 2, start_y + i * 40)
+                self._menu_option_surfs.append((normal, highlighted, pos))
+        for i, (normal, highlighted, pos) in enumerate(self._menu_option_surfs):
+            self.screen.blit(highlighted if i == selected else normal, pos)
+
+        if self._menu_difficulty_cache[0] != self.difficulty:
+            self._menu_difficulty_cache = (self.difficulty, self.font_tiny.render(
                 f"Dificuldade atual: {self.difficulty}", True, Colors.WHITE
-            )
-            self.screen.blit(diff_text, (self.config.WIDTH // 2 - diff_text.get_width() // 2, start_y + len(menu_options) * 40 + 20))
+            ))
+        diff_text = self._menu_difficulty_cache[1]
+        self.screen.blit(diff_text, (self.config.WIDTH // 2 - diff_text.get_width() // 2, start_y + len(menu_options) * 40 + 20))
 
-            if message:
-                msg = self.font_tiny.render(message, True, Colors.WHITE)
-                self.screen.blit(msg, (self.config.WIDTH // 2 - msg.get_width() // 2, self.config.HEIGHT - 80))
-                message_timer -= 1
-                if message_timer <= 0:
-                    message = ""
+        if message:
+            if message != self._menu_msg_text:
+                self._menu_msg_surf = self.font_tiny.render(message, True, Colors.WHITE)
+                self._menu_msg_text = message
+            msg = self._menu_msg_surf
+            self.screen.blit(msg, (self.config.WIDTH // 2 - msg.get_width() // 2, self.config.HEIGHT - 80))
 
-            pygame.display.flip()
+    def run_menu(self) -> bool:
+        """Executa menu. Retorna False se deve sair do jogo"""
+        menu_options = ["Novo jogo", "Multiplayer", "Carregar jogo salvo", "Escolher dificuldade", "Configurações", "Sair"]
+        selected = 0
+        message = ""
+        message_until = 0
+        menu_dirty = True
 
-            for event in pygame.event.get():
+        while self.state == GameState.MENU:
+            if message and pygame.time.get_ticks() >= message_until:
+                message = ""
+                menu_dirty = True
+
+            # Só redesenha quando algo mudou (tecla, mensagem ou janela reexposta)
+            if menu_dirty:
+                self._draw_main_menu(menu_options, selected, message)
+                pygame.display.flip()
+                menu_dirty = False
+
+            # Com mensagem na tela acorda a tempo de apagá-la; sem ela espera só por entrada
+            timeout = max(1, message_until - pygame.time.get_ticks()) if message else 0
+            for event in self._wait_menu_events(timeout):
                 if event.type == pygame.QUIT:
                     return False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    menu_dirty = True
                 elif event.type == pygame.KEYDOWN:
+                    menu_dirty = True
                     if event.key in (pygame.K_DOWN, pygame.K_s):
                         selected = (selected + 1) % len(menu_options)
                     elif event.key in (pygame.K_UP, pygame.K_w):
@@ -1821,7 +2276,7 @@ class SpaceAtaque:
                         elif choice == "Carregar jogo salvo":
                             if not self.load_game():
                                 message = "Nenhum jogo salvo encontrado."
-                                message_timer = self.config.FPS * 2
+                                message_until = pygame.time.get_ticks() + 2000
                         elif choice == "Escolher dificuldade":
                             self._difficulty_menu()
                         elif choice == "Configurações":
@@ -1831,8 +2286,6 @@ class SpaceAtaque:
                     elif event.key == pygame.K_ESCAPE:
                         return False
 
-            self.clock.tick(self.config.FPS)
-
         return True
 
     def _difficulty_menu(self):
@@ -1845,32 +2298,47 @@ class SpaceAtaque:
         except Exception:
             pass
 
-        while choosing:
-            self.screen.blit(self.bg_menu, (0, 0))
+        # Textos renderizados uma vez por entrada no menu; opções nas duas cores (normal, selecionada)
+        # Posições de blit também calculadas aqui: a largura de cada texto não muda
+        center_x = self.config.WIDTH // 2
+        title = self.font_medium.render("Escolher dificuldade", True, Colors.YELLOW)
+        title_pos = (center_x - title.get_width() // 2, 80)
+        labels = []
+        for i, diff in enumerate(diffs):
+            normal = self.font_tiny.render(diff, True, Colors.WHITE)
+            highlighted = self.font_tiny.render(diff, True, Colors.YELLOW)
+            labels.append((normal, highlighted, (center_x - normal.get_width() // 2, 220 + i * 40)))
+        hint = self.font_tiny.render(
+            "ENTER para confirmar • ESC para voltar", True, Colors.WHITE
+        )
+        hint_pos = (center_x - hint.get_width() // 2, 400)
+
+        menu_dirty = True
 
-            title = self.font_medium.render("Escolher dificuldade", True, Colors.YELLOW)
-            self.screen.blit(title, (self.config.WIDTH // 2 - title.get_width() // 2, 80))
+        while choosing:
+            if menu_dirty:
+                self.screen.blit(self.bg_menu, (0, 0))
+                self.screen.blit(title, title_pos)
 
-            for i, diff in enumerate(diffs):
-                color = Colors.YELLOW if i == selected else Colors.WHITE
-                label = self.font_tiny.render(diff, True, color)
-                self.screen.blit(label, (self.config.WIDTH // 2 - label.get_width() // 2, 220 + i * 40))
+                for i, (normal, highlighted, pos) in enumerate(labels):
+                    self.screen.blit(highlighted if i == selected else normal, pos)
 
-            hint = self.font_tiny.render(
-                "ENTER para confirmar • ESC para voltar", True, Colors.WHITE
-            )
-            self.screen.blit(hint, (self.config.WIDTH // 2 - hint.get_width() // 2, 400))
+                self.screen.blit(hint, hint_pos)
 
-            pygame.display.flip()
+                pygame.display.flip()
+                menu_dirty = False
 
-            for event in pygame.event.get():
+            for event in self._wait_menu_events():
                 if event.type == pygame.QUIT:
                     choosing = False
                     try:
                         self._stop_loop("_space_bridge_playing", "_chan_space_bridge")
                     except Exception:
                         pass
+                elif event.type == pygame.WINDOWEXPOSED:
+                    menu_dirty = True
                 elif event.type == pygame.KEYDOWN:
+                    menu_dirty = True
                     if event.key in (pygame.K_DOWN, pygame.K_s):
                         selected = (selected + 1) % len(diffs)
                     elif event.key in (pygame.K_UP, pygame.K_w):
@@ -1889,8 +2357,6 @@ class SpaceAtaque:
                         except Exception:
                             pass
 
-            self.clock.tick(self.config.FPS)
-
     def _settings_menu(self):
         """Menu de configurações de áudio (volumes e ativação por som)."""
         options = [
@@ -1912,28 +2378,37 @@ class SpaceAtaque:
             except Exception:
                 return 0
 
+        # Título e dica são fixos: renderizados uma vez por abertura do menu
+        title = self.font_medium.render("Configurações de Áudio", True, Colors.YELLOW)
+        title_pos = (self.config.WIDTH // 2 - title.get_width() // 2, 80)
+        hint1 = self.font_tiny.render("↑/↓ selecionar  •  ←/→ volume  •  ENTER/ESPAÇO liga/desliga  •  ESC voltar", True, Colors.WHITE)
+        hint1_pos = (self.config.WIDTH // 2 - hint1.get_width() // 2, 420)
+
+        menu_dirty = True
+
         while choosing:
-            self.screen.blit(self.bg_menu, (0, 0))
+            # Só redesenha quando algo mudou (tecla ou janela reexposta)
+            if menu_dirty:
+                self.screen.blit(self.bg_menu, (0, 0))
 
-            title = self.font_medium.render("Configurações de Áudio", True, Colors.YELLOW)
-            self.screen.blit(title, (self.config.WIDTH // 2 - title.get_width() // 2, 80))
+                self.screen.blit(title, title_pos)
 
-            start_y = 200
-            for i, (key, label_text) in enumerate(options):
-                enabled = self.sound_enabled.get(key, True)
-                vol = _vol_to_percent(self.volumes.get(key, 0.0))
-                status = "Ligado" if enabled else "Desligado"
-                text = f"{label_text}: {vol}%  ({status})"
-                color = Colors.YELLOW if i == selected else Colors.WHITE
-                label = self.font_tiny.render(text, True, color)
-                self.screen.blit(label, (self.config.WIDTH // 2 - label.get_width() // 2, start_y + i * 40))
+                start_y = 200
+                for i, (key, label_text) in enumerate(options):
+                    enabled = self.sound_enabled.get(key, True)
+                    vol = _vol_to_percent(self.volumes.get(key, 0.0))
+                    status = "Ligado" if enabled else "Desligado"
+                    text = f"{label_text}: {vol}%  ({status})"
+                    color = Colors.YELLOW if i == selected else Colors.WHITE
+                    label = self.font_tiny.render(text, True, color)
+                    self.screen.blit(label, (self.config.WIDTH // 2 - label.get_width() // 2, start_y + i * 40))
 
-            hint1 = self.font_tiny.render("↑/↓ selecionar  •  ←/→ volume  •  ENTER/ESPAÇO liga/desliga  •  ESC voltar", True, Colors.WHITE)
-            self.screen.blit(hint1, (self.config.WIDTH // 2 - hint1.get_width() // 2, 420))
+                self.screen.blit(hint1, hint1_pos)
 
-            pygame.display.flip()
+                pygame.display.flip()
+                menu_dirty = False
 
-            for event in pygame.event.get():
+            for event in self._wait_menu_events():
                 if event.type == pygame.QUIT:
                     choosing = False
                     self.state = GameState.MENU
@@ -1941,7 +2416,10 @@ class SpaceAtaque:
                         self._stop_loop("_space_bridge_playing", "_chan_space_bridge")
                     except Exception:
                         pass
+                elif event.type == pygame.WINDOWEXPOSED:
+                    menu_dirty = True
                 elif event.type == pygame.KEYDOWN:
+                    menu_dirty = True
                     if event.key in (pygame.K_DOWN, pygame.K_s):
                         selected = (selected + 1) % len(options)
                     elif event.key in (pygame.K_UP, pygame.K_w):
@@ -1952,7 +2430,7 @@ class SpaceAtaque:
                         current = _vol_to_percent(self.volumes.get(key, 0.0))
                         new_percent = max(0, min(100, current + step))
                         self.volumes[key] = new_percent / 100.0
-                        self._apply_volumes()
+                        self._apply_volumes(only=key)
                     elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         key, _ = options[selected]
                         self.sound_enabled[key] = not self.sound_enabled.get(key, True)
@@ -1967,12 +2445,10 @@ class SpaceAtaque:
                                     pygame.mixer.music.pause()
                                 except Exception:
                                     pass
-                        self._apply_volumes()
+                        self._apply_volumes(only=key)
                     elif event.key == pygame.K_ESCAPE:
                         choosing = False
 
-            self.clock.tick(self.config.FPS)
-
     def run_game_over(self) -> bool:
         """Executa tela de game over. Retorna False se deve sair"""
         highscore = self.save_manager.save(
@@ -2034,15 +2510,13 @@ class SpaceAtaque:
 
         waiting = True
         while waiting:
-            for event in pygame.event.get():
+            for event in self._wait_menu_events():
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.KEYDOWN:
                     waiting = False
                     self.state = GameState.MENU
 
-            self.clock.tick(self.config.FPS)
-
         return True
 
     def run_victory(self) -> bool:
@@ -2111,63 +2585,106 @@ class SpaceAtaque:
         start_time = pygame.time.get_ticks()
         TIMEOUT_MS = 5000
         while waiting:
-            for event in pygame.event.get():
+            remaining = TIMEOUT_MS - (pygame.time.get_ticks() - start_time)
+            if remaining <= 0:
+                waiting = False
+                self.state = GameState.MENU
+                break
+            for event in self._wait_menu_events(remaining):
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.KEYDOWN:
                     waiting = False
                     self.state = GameState.MENU
-            if pygame.time.get_ticks() - start_time >= TIMEOUT_MS:
-                waiting = False
-                self.state = GameState.MENU
-            self.clock.tick(self.config.FPS)
 
         return True
 
+    def run_playing_frame(self) -> bool:
+        """Processa um quadro de gameplay. Retorna False se deve encerrar o jogo"""
+        running = True
+        # O posicionamento é absoluto: só a última posição do mouse no quadro importa
+        pointer_pos = None
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.state = GameState.PAUSED
+            elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                pointer_pos = event.pos
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw_pending = True
+        if pointer_pos is not None:
+            self.player.move_to_position(pointer_pos[0], pointer_pos[1], self.config.WIDTH, self.config.HEIGHT)
+
+        if running and self.state == GameState.PLAYING:
+            step_ms = self._update_step_ms
+            if self._update_accum_ms is None:
+                # Vindo de outra tela: descarta o tempo passado fora do gameplay
+                self.clock.tick()
+                self._update_accum_ms = step_ms
+            accum = self._update_accum_ms
+            steps = 0
+            # Tolerância de 1 ms: tick() mede em milissegundos inteiros (16/17 ms a 60 FPS)
+            while accum + 1.0 >= step_ms and steps < self.MAX_UPDATE_STEPS:
+                self.update_gameplay()
+                accum -= step_ms
+                steps += 1
+                if self.state != GameState.PLAYING:
+                    break
+            # Atraso além do limite de passos é descartado (o jogo desacelera em vez de saltar)
+            self._update_accum_ms = min(accum, step_ms)
+
+            dirty = self.draw_gameplay(full_redraw=self._full_redraw_pending)
+            self._full_redraw_pending = False
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            # Espera ativa em C: ritmo de quadros estável no gameplay
+            self._update_accum_ms += self.clock.tick_busy_loop(self.config.FPS)
+        return running
+
+    def run_phase_victory(self) -> bool:
+        """Tela de fase vencida: redesenha só quando a contagem muda. Retorna False se deve encerrar"""
+        if self._phase_victory_dirty:
+            self.draw_phase_victory()
+            pygame.display.flip()
+            self._phase_victory_dirty = False
+
+        # Sem polling: dorme até o próximo evento (timers da fase ou entrada)
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type in (PHASE_COUNTDOWN_EVENT, pygame.WINDOWEXPOSED):
+            self._phase_victory_dirty = True
+        elif event.type == PHASE_ADVANCE_EVENT:
+            pygame.time.set_timer(PHASE_COUNTDOWN_EVENT, 0)
+            self._advance_phase()
+        return True
+
     def run(self):
         """Loop principal do jogo"""
+        # Despacho por dicionário: uma busca por iteração no lugar da cadeia de if/elif
+        handlers = {
+            GameState.MENU: self.run_menu,
+            GameState.PLAYING: self.run_playing_frame,
+            GameState.PAUSED: self.run_pause,
+            GameState.PHASE_VICTORY: self.run_phase_victory,
+            GameState.GAME_OVER: self.run_game_over,
+            GameState.VICTORY: self.run_victory,
+        }
+        playing = GameState.PLAYING
         running = True
 
         while running:
-            if self.state == GameState.MENU:
-                running = self.run_menu()
-
-            elif self.state == GameState.PLAYING:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        self.state = GameState.PAUSED
-                    elif event.type == pygame.MOUSEMOTION:
-                        self.player.move_to_position(event.pos[0], event.pos[1], self.config.WIDTH, self.config.HEIGHT)
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        self.player.move_to_position(event.pos[0], event.pos[1], self.config.WIDTH, self.config.HEIGHT)
-
-                if running and self.state == GameState.PLAYING:
-                    self.update_gameplay()
-                    self.draw_gameplay()
-                    pygame.display.flip()
-                    self.clock.tick(self.config.FPS)
-
-            elif self.state == GameState.PAUSED:
-                running = self.run_pause()
-
-            elif self.state == GameState.PHASE_VICTORY:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-
-                if running:
-                    self.draw_phase_victory()
-                    pygame.display.flip()
-                    self.clock.tick(self.config.FPS)
-
-            elif self.state == GameState.GAME_OVER:
-                running = self.run_game_over()
-
-            elif self.state == GameState.VICTORY:
-                running = self.run_victory()
-
+            state = self.state
+            if state is not playing:
+                # Telas fora do gameplay sobrescrevem a tela inteira e param o relógio da simulação
+                self._full_redraw_pending = True
+                self._update_accum_ms = None
+            running = handlers[state]()
+
+        self.save_manager.flush()
         pygame.quit()
 
 